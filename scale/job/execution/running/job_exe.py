@@ -72,6 +72,16 @@ class RunningJobExecution(object):
 
         return self._current_task
 
+    @property
+    def all_tasks(self):
+        """Returns all of the tasks (finished, current, and remaining) of the job execution
+
+        :returns: The list of all tasks
+        :rtype: [:class:`job.execution.running.tasks.base_task.Task`]
+        """
+
+        return self._all_tasks
+
     @property
     def id(self):
         """Returns the ID of this job execution
@@ -117,46 +127,32 @@ class RunningJobExecution(object):
                 task.populate_job_exe_model(job_exe)
             job_exe.save()
 
-        with self._lock:
-            task = self._current_task
-            self._current_task = None
-            self._remaining_tasks = []
-            return task
+        return self.clear_tasks()
 
     @retry_database_query
-    def execution_lost(self, when):
-        """Fails this job execution for its node becoming lost and returns the current task
+    def execution_timed_out(self, when):
+        """Fails this job execution for timing out and returns the current task
 
-        :param when: The time that the node was lost
+        :param when: The time that the job execution timed out
         :type when: :class:`datetime.datetime`
         :returns: The current task, possibly None
         :rtype: :class:`job.execution.running.tasks.base_task.Task`
         """
 
-        error = Error.objects.get_builtin_error('node-lost')
+        error = Error.objects.get_builtin_error('timeout')
         from queue.models import Queue
         Queue.objects.handle_job_failure(self._id, when, self._all_tasks, error)
 
-        with self._lock:
-            task = self._current_task
-            self._current_task = None
-            self._remaining_tasks = []
-            return task
+        return self.clear_tasks()
 
-    @retry_database_query
-    def execution_timed_out(self, when):
-        """Fails this job execution for timing out and returns the current task
+    def clear_tasks(self):
+        """Clears the current and remaining tasks of this job execution and returns the current task. This does not
+        update the database, so the caller must have already saved the job execution's final status.
 
-        :param when: The time that the job execution timed out
-        :type when: :class:`datetime.datetime`
         :returns: The current task, possibly None
         :rtype: :class:`job.execution.running.tasks.base_task.Task`
         """
 
-        error = Error.objects.get_builtin_error('timeout')
-        from queue.models import Queue
-        Queue.objects.handle_job_failure(self._id, when, self._all_tasks, error)
-
         with self._lock:
             task = self._current_task
             self._current_task = None
@@ -1,8 +1,17 @@
 """Defines the class that managers the currently running job executions"""
 from __future__ import unicode_literals
 
+import logging
 import threading
 
+from django.db import DatabaseError
+
+from error.models import Error
+from util.retry import retry_database_query
+
+
+logger = logging.getLogger(__name__)
+
 
 class RunningJobExecutionManager(object):
     """This class manages all currently running job execution. This class is thread-safe."""
@@ -25,6 +34,41 @@ class RunningJobExecutionManager(object):
             for job_exe in job_exes:
                 self._job_exes[job_exe.id] = job_exe
 
+    def fail_job_exes_on_node(self, node_id, when):
+        """Fails all running job executions on the given node for the node becoming lost. All of the executions are
+        failed in a single database transaction and then removed from the manager. If the database update fails, the
+        executions are kept and the IDs of their current tasks are returned so they can be reconciled.
+
+        :param node_id: The ID of the lost node
+        :type node_id: int
+        :param when: The time that the node was lost
+        :type when: :class:`datetime.datetime`
+        :returns: A tuple of the failed job execution IDs and the task IDs that need to be reconciled
+        :rtype: ([int], [str])
+        """
+
+        job_exes = self.get_job_exes_on_node(node_id)
+        if not job_exes:
+            return [], []
+
+        try:
+            self._fail_job_exes(job_exes, when, Error.objects.get_builtin_error('node-lost'))
+        except DatabaseError:
+            logger.exception('Error failing lost job executions on node %i', node_id)
+            task_ids = []
+            for job_exe in job_exes:
+                task = job_exe.current_task
+                if task:
+                    task_ids.append(task.id)
+            return [], task_ids
+
+        failed_ids = []
+        for job_exe in job_exes:
+            job_exe.clear_tasks()
+            failed_ids.append(job_exe.id)
+        self.remove_job_exes(failed_ids)
+        return failed_ids, []
+
     def get_all_job_exes(self):
         """Returns all running job executions
 
@@ -53,6 +97,23 @@ class RunningJobExecutionManager(object):
             except KeyError:
                 return None
 
+    def get_job_exes(self, job_exe_ids):
+        """Returns the running job executions with the given IDs. Any ID that does not have a running job execution will
+        not be included in the result.
+
+        :param job_exe_ids: The IDs of the job executions to return
+        :type job_exe_ids: [int]
+        :returns: The running job executions stored by ID
+        :rtype: {int: :class:`job.execution.running.job_exe.RunningJobExecution`}
+        """
+
+        result = {}
+        with self._lock:
+            for job_exe_id in job_exe_ids:
+                if job_exe_id in self._job_exes:
+                    result[job_exe_id] = self._job_exes[job_exe_id]
+        return result
+
     def get_job_exes_on_node(self, node_id):
         """Returns all running job executions that are on the given node
 
@@ -85,6 +146,17 @@ class RunningJobExecutionManager(object):
                     result.append(self._job_exes[job_exe_id])
         return result
 
+    def remove_job_exes(self, job_exe_ids):
+        """Removes the running job executions with the given IDs
+
+        :param job_exe_ids: The IDs of the job executions to remove
+        :type job_exe_ids: [int]
+        """
+
+        with self._lock:
+            for job_exe_id in job_exe_ids:
+                self._job_exes.pop(job_exe_id, None)
+
     def remove_job_exe(self, job_exe_id):
         """Removes the running job execution with the given ID
 
@@ -97,3 +169,24 @@ class RunningJobExecutionManager(object):
                 del self._job_exes[job_exe_id]
             except KeyError:
                 pass
+
+    @retry_database_query
+    def _fail_job_exes(self, job_exes, when, error):
+        """Fails the given running job executions in the database
+
+        :param job_exes: The running job executions to fail
+        :type job_exes: [:class:`job.execution.running.job_exe.RunningJobExecution`]
+        :param when: The time that the job executions failed
+        :type when: :class:`datetime.datetime`
+        :param error: The error that caused the failures
+        :type error: :class:`error.models.Error`
+        """
+
+        job_exe_ids = []
+        tasks = {}
+        for job_exe in job_exes:
+            job_exe_ids.append(job_exe.id)
+            tasks[job_exe.id] = job_exe.all_tasks
+
+        from queue.models import Queue
+        Queue.objects.handle_job_failures(job_exe_ids, when, tasks, error)
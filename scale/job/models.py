@@ -863,6 +863,17 @@ class JobExecutionManager(models.Manager):
 
         return self.select_for_update().defer('stdout', 'stderr').get(pk=job_exe_id)
 
+    def get_locked_job_exes(self, job_exe_ids):
+        """Returns the job executions with the given IDs with model locks obtained (in ID order to prevent deadlocks)
+
+        :param job_exe_ids: The job execution IDs
+        :type job_exe_ids: [int]
+        :returns: The job execution models with model locks
+        :rtype: [:class:`job.models.JobExecution`]
+        """
+
+        return list(self.select_for_update().defer('stdout', 'stderr').filter(id__in=job_exe_ids).order_by('id'))
+
     def get_logs(self, job_exe_id):
         """Gets additional details for the given job execution model based on related model attributes.
 
@@ -904,6 +915,16 @@ class JobExecutionManager(models.Manager):
 
         return results
 
+    def get_running_job_exe_ids(self):
+        """Returns the IDs of all job executions that are currently RUNNING on a node. Only the IDs are queried, so no
+        job execution models are created.
+
+        :returns: An iterator over the IDs of the RUNNING job executions
+        :rtype: iterator of int
+        """
+
+        return self.filter(status='RUNNING').values_list('id', flat=True).iterator()
+
     def get_running_job_exes(self):
         """Returns all job executions that are currently RUNNING on a node
 
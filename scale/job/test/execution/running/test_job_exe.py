@@ -186,35 +186,23 @@ class TestRunningJobExecution(TestCase):
         self.assertEqual(Error.objects.get_builtin_error('timeout').id, job_exe.error_id)
         self.assertEqual(when_timed_out, job_exe.ended)
 
-    def test_lost_job_execution(self):
-        """Tests running through a job execution that gets lost"""
+    def test_clear_tasks(self):
+        """Tests clearing the tasks of a running job execution"""
 
         job_exe = JobExecution.objects.get_job_exe_with_job_and_job_type(self._job_exe_id)
         running_job_exe = RunningJobExecution(job_exe)
 
-        # Start, run, and complete pre-task
-        task = running_job_exe.start_next_task()
-        pre_task_id = task.id
-        pre_task_started = now()
-        running_job_exe.task_start(pre_task_id, pre_task_started)
-        pre_task_completed = pre_task_started + timedelta(seconds=1)
-        pre_task_results = TaskResults(pre_task_id)
-        pre_task_results.exit_code = 0
-        pre_task_results.when = pre_task_completed
-        running_job_exe.task_complete(pre_task_results)
-
-        # Start job-task and then execution gets lost
-        when_lost = pre_task_completed + timedelta(seconds=1)
-        job_task = running_job_exe.start_next_task()
-        lost_task = running_job_exe.execution_lost(when_lost)
-        self.assertEqual(job_task.id, lost_task.id)
+        # Start pre-task and then clear the tasks
+        pre_task = running_job_exe.start_next_task()
+        cleared_task = running_job_exe.clear_tasks()
+        self.assertEqual(pre_task.id, cleared_task.id)
         self.assertTrue(running_job_exe.is_finished())
         self.assertFalse(running_job_exe.is_next_task_ready())
+        self.assertIsNone(running_job_exe.clear_tasks())
 
+        # Database should not be changed
         job_exe = JobExecution.objects.get(id=self._job_exe_id)
-        self.assertEqual('FAILED', job_exe.status)
-        self.assertEqual(Error.objects.get_builtin_error('node-lost').id, job_exe.error_id)
-        self.assertEqual(when_lost, job_exe.ended)
+        self.assertEqual('RUNNING', job_exe.status)
 
     def test_canceled_job_execution(self):
         """Tests running through a job execution that gets canceled"""
@@ -0,0 +1,121 @@
+from __future__ import unicode_literals
+
+from datetime import timedelta
+
+import django
+from django.db import DatabaseError
+from django.test import TestCase
+from django.utils.timezone import now
+from mock import MagicMock, patch
+
+import job.test.utils as job_test_utils
+from error.models import CACHED_BUILTIN_ERRORS, Error
+from job.execution.running.job_exe import RunningJobExecution
+from job.execution.running.manager import RunningJobExecutionManager
+from job.execution.running.tasks.results import TaskResults
+from job.models import JobExecution
+from scheduler.models import Scheduler
+
+
+class TestRunningJobExecutionManager(TestCase):
+    """Tests the RunningJobExecutionManager class"""
+
+    fixtures = ['basic_job_errors.json']
+
+    def setUp(self):
+        django.setup()
+
+        CACHED_BUILTIN_ERRORS.clear()
+        Scheduler.objects.initialize_scheduler()
+
+        self._job_exe_1 = MagicMock()
+        self._job_exe_1.id = 1
+        self._job_exe_2 = MagicMock()
+        self._job_exe_2.id = 2
+
+        self._manager = RunningJobExecutionManager()
+        self._manager.add_job_exes([self._job_exe_1, self._job_exe_2])
+
+    def test_get_job_exes(self):
+        """Tests calling get_job_exes() with known and unknown job execution IDs"""
+
+        job_exes = self._manager.get_job_exes([1, 2, 3])
+
+        self.assertDictEqual(job_exes, {1: self._job_exe_1, 2: self._job_exe_2})
+
+    def test_get_job_exes_empty(self):
+        """Tests calling get_job_exes() with no job execution IDs"""
+
+        self.assertDictEqual(self._manager.get_job_exes([]), {})
+
+    def test_remove_job_exes(self):
+        """Tests calling remove_job_exes() with known and unknown job execution IDs"""
+
+        self._manager.remove_job_exes([1, 3])
+
+        self.assertIsNone(self._manager.get_job_exe(1))
+        self.assertEqual(self._manager.get_job_exe(2), self._job_exe_2)
+
+    def test_fail_job_exes_on_node(self):
+        """Tests running through a job execution that gets lost when its node is lost"""
+
+        job_type = job_test_utils.create_job_type(max_tries=1)
+        job = job_test_utils.create_job(job_type=job_type, num_exes=1)
+        job_exe = job_test_utils.create_job_exe(job=job, status='RUNNING')
+        job_exe = JobExecution.objects.get_job_exe_with_job_and_job_type(job_exe.id)
+        running_job_exe = RunningJobExecution(job_exe)
+        self._manager.add_job_exes([running_job_exe])
+
+        # Start, run, and complete pre-task
+        task = running_job_exe.start_next_task()
+        pre_task_id = task.id
+        pre_task_started = now()
+        running_job_exe.task_start(pre_task_id, pre_task_started)
+        pre_task_completed = pre_task_started + timedelta(seconds=1)
+        pre_task_results = TaskResults(pre_task_id)
+        pre_task_results.exit_code = 0
+        pre_task_results.when = pre_task_completed
+        running_job_exe.task_complete(pre_task_results)
+
+        # Start job-task and then node gets lost
+        when_lost = pre_task_completed + timedelta(seconds=1)
+        running_job_exe.start_next_task()
+        failed_ids, task_ids = self._manager.fail_job_exes_on_node(running_job_exe.node_id, when_lost)
+        self.assertListEqual(failed_ids, [running_job_exe.id])
+        self.assertListEqual(task_ids, [])
+        self.assertTrue(running_job_exe.is_finished())
+        self.assertFalse(running_job_exe.is_next_task_ready())
+        self.assertIsNone(self._manager.get_job_exe(running_job_exe.id))
+
+        job_exe = JobExecution.objects.get(id=running_job_exe.id)
+        self.assertEqual('FAILED', job_exe.status)
+        self.assertEqual(Error.objects.get_builtin_error('node-lost').id, job_exe.error_id)
+        self.assertEqual(when_lost, job_exe.ended)
+        # Task info should be saved
+        self.assertEqual(pre_task_started, job_exe.pre_started)
+        self.assertEqual(pre_task_completed, job_exe.pre_completed)
+        self.assertEqual(0, job_exe.pre_exit_code)
+
+    @patch('queue.models.Queue.objects.handle_job_failures')
+    def test_fail_job_exes_on_node_database_error(self, mock_handle_job_failures):
+        """Tests that job executions are kept and their tasks returned for reconciliation when failing them errors"""
+
+        mock_handle_job_failures.side_effect = DatabaseError('Test error')
+        self._job_exe_1.node_id = 1
+        self._job_exe_1.current_task.id = 'task_1'
+        self._job_exe_2.node_id = 2
+
+        failed_ids, task_ids = self._manager.fail_job_exes_on_node(1, now())
+
+        self.assertListEqual(failed_ids, [])
+        self.assertListEqual(task_ids, ['task_1'])
+        self.assertFalse(self._job_exe_1.clear_tasks.called)
+        self.assertEqual(self._manager.get_job_exe(1), self._job_exe_1)
+
+    def test_fail_job_exes_on_node_none(self):
+        """Tests calling fail_job_exes_on_node() for a node with no job executions"""
+
+        self._job_exe_1.node_id = 1
+        self._job_exe_2.node_id = 1
+
+        self.assertTupleEqual(self._manager.fail_job_exes_on_node(2, now()), ([], []))
@@ -331,6 +331,10 @@ class TestJobExecutionManager(TransactionTestCase):
         latest_job_exes = JobExecution.objects.get_latest(job_query)
         self.assertDictEqual(latest_job_exes, expected_result, 'latest job executions do not match expected results')
 
+    def test_get_running_job_exe_ids(self):
+        job_exe_ids = JobExecution.objects.get_running_job_exe_ids()
+        self.assertSetEqual(set(job_exe_ids), {self.last_run_1a.id, self.last_run_2a.id})
+
     def test_get_latest_job_exes_with_a_filter(self):
         job_query = Job.objects.filter(status='FAILED')
         expected_result = {
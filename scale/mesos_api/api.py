@@ -4,12 +4,19 @@ import json
 import logging
 import re
 import urllib
-import urllib2
+import urlparse
+
+import urllib3
 
 logger = logging.getLogger(__name__)
 
 PORT_REGEX = re.compile(r'.*?\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}:(\d+)')
 
+# Shared pool of keep-alive HTTP connections to the Mesos master and slaves, thread-safe and reused across calls
+HTTP_POOL = urllib3.PoolManager(num_pools=32, maxsize=8, timeout=urllib3.Timeout(connect=5.0, read=30.0))
+# The maximum number of redirects followed for a single request (the master redirects to the leading master)
+MAX_REDIRECTS = 10
+
 
 class MesosError(Exception):
     """Error when there is a problem fetching results from the Mesos REST API"""
@@ -140,12 +147,12 @@ def get_scheduler(hostname, port):
     # Fetch raw status information from the Mesos API
     try:
         url = 'http://%s:%i/master/state.json' % (hostname, port)
-        response = urllib2.urlopen(url)
-        if response.code != 200:
+        response = _request(url)
+        if response.status != 200:
             raise MesosError('Failed to read response from master: %s:%i' % (hostname, port))
-        state_dict = json.load(response)
+        state_dict = json.loads(response.data)
     except MesosError:
-        logger.exception('Mesos API returned unexpected status code: %s:%i -> %i' % (hostname, port, response.code))
+        logger.exception('Mesos API returned unexpected status code: %s:%i -> %i' % (hostname, port, response.status))
         raise
     except:
         logger.exception('Mesos API unavailable: %s:%i' % (hostname, port))
@@ -231,8 +238,7 @@ def get_slave_task_run_id(hostname, port, task_id):
     :raises MesosError: If the task cannot be found
     """
     url = 'http://%s:%i/state.json' % (hostname, port)
-    response = urllib2.urlopen(url)
-    state_dict = json.load(response)
+    state_dict = json.loads(_get_url(url))
     for framework in state_dict['frameworks']:
         for executor in framework['executors']:
             if executor['id'] == task_id:
@@ -259,8 +265,7 @@ def get_slave_task_file(hostname, port, task_dir, file_name):
     :rtype: str
     """
     url = get_slave_task_url(hostname, port, task_dir, file_name)
-    response = urllib2.urlopen(url)
-    return response.read()
+    return _get_url(url)
 
 
 def get_slave_task_url(hostname, port, task_dir, file_name):
@@ -282,6 +287,42 @@ def get_slave_task_url(hostname, port, task_dir, file_name):
     return base_url + query_args
 
 
+def _get_url(url):
+    """Performs an HTTP GET on the given URL using the shared connection pool and returns the response body
+
+    :param url: The URL to get
+    :type url: str
+    :returns: The body of the response
+    :rtype: str
+    :raises MesosError: If the response does not have a 200 status code
+    """
+
+    response = _request(url)
+    if response.status != 200:
+        raise MesosError('Mesos API returned status code %i: %s' % (response.status, url))
+    return response.data
+
+
+def _request(url):
+    """Performs an HTTP GET on the given URL using the shared connection pool. Redirects are followed here instead of
+    by urllib3, which counts them against its retries and would otherwise also retry failed connections.
+
+    :param url: The URL to get
+    :type url: str
+    :returns: The final response, which is the last redirect response if more than MAX_REDIRECTS are received
+    :rtype: :class:`urllib3.response.HTTPResponse`
+    """
+
+    response = HTTP_POOL.request('GET', url, retries=0, redirect=False)
+    for _ in range(MAX_REDIRECTS):
+        redirect_location = response.get_redirect_location()
+        if not redirect_location:
+            break
+        url = urlparse.urljoin(url, redirect_location)
+        response = HTTP_POOL.request('GET', url, retries=0, redirect=False)
+    return response
+
+
 def _get_slave_dict(hostname, port, slave_id):
     """Queries the Mesos master REST API to get information for the given slave
 
@@ -311,8 +352,7 @@ def _get_slaves_dict(hostname, port):
     :rtype: dict
     """
     url = 'http://%s:%i/master/state.json' % (hostname, port)
-    response = urllib2.urlopen(url)
-    state_dict = json.load(response)
+    state_dict = json.loads(_get_url(url))
     return state_dict['slaves']
 
 
@@ -340,8 +380,7 @@ def _parse_slave_info(slave_dict):
 
 def _parse_slave_resources(hostname, port):
     url = 'http://%s:%i/state.json' % (hostname, port)
-    response = urllib2.urlopen(url)
-    state_dict = json.load(response)
+    state_dict = json.loads(_get_url(url))
 
     # Extract the total resource usage metrics
     total_dict = state_dict['resources']
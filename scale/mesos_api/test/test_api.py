@@ -0,0 +1,71 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+from mock import MagicMock, call, patch
+
+from mesos_api.api import MAX_REDIRECTS, MesosError, _get_url
+
+
+def _create_response(status, data='', redirect_location=False):
+    """Creates a mocked urllib3 response for testing"""
+
+    response = MagicMock()
+    response.status = status
+    response.data = data
+    response.get_redirect_location.return_value = redirect_location
+    return response
+
+
+class TestGetUrl(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    @patch('mesos_api.api.HTTP_POOL.request')
+    def test_successful(self, mock_request):
+        """Tests calling _get_url() successfully without retrying the request"""
+
+        mock_request.return_value = _create_response(200, '{}')
+
+        self.assertEqual(_get_url('http://master:5050/master/state.json'), '{}')
+        mock_request.assert_called_once_with('GET', 'http://master:5050/master/state.json', retries=0, redirect=False)
+
+    @patch('mesos_api.api.HTTP_POOL.request')
+    def test_bad_status(self, mock_request):
+        """Tests calling _get_url() when the response does not have a 200 status code"""
+
+        mock_request.return_value = _create_response(500)
+
+        self.assertRaises(MesosError, _get_url, 'http://master:5050/master/state.json')
+
+    @patch('mesos_api.api.HTTP_POOL.request')
+    def test_redirect(self, mock_request):
+        """Tests calling _get_url() when the master redirects to the leading master"""
+
+        mock_request.side_effect = [_create_response(307, redirect_location='http://leader:5050/master/state.json'),
+                                    _create_response(200, '{}')]
+
+        self.assertEqual(_get_url('http://master:5050/master/state.json'), '{}')
+        self.assertListEqual(mock_request.call_args_list,
+                             [call('GET', 'http://master:5050/master/state.json', retries=0, redirect=False),
+                              call('GET', 'http://leader:5050/master/state.json', retries=0, redirect=False)])
+
+    @patch('mesos_api.api.HTTP_POOL.request')
+    def test_relative_redirect(self, mock_request):
+        """Tests calling _get_url() with a redirect to a relative location"""
+
+        mock_request.side_effect = [_create_response(302, redirect_location='/master/redirected.json'),
+                                    _create_response(200, '{}')]
+
+        self.assertEqual(_get_url('http://master:5050/master/state.json'), '{}')
+        mock_request.assert_called_with('GET', 'http://master:5050/master/redirected.json', retries=0, redirect=False)
+
+    @patch('mesos_api.api.HTTP_POOL.request')
+    def test_too_many_redirects(self, mock_request):
+        """Tests calling _get_url() when the redirects do not end"""
+
+        mock_request.return_value = _create_response(307, redirect_location='http://master:5050/master/state.json')
+
+        self.assertRaises(MesosError, _get_url, 'http://master:5050/master/state.json')
+        self.assertEqual(mock_request.call_count, MAX_REDIRECTS + 1)
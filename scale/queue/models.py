@@ -376,7 +376,6 @@ class QueueManager(models.Manager):
             if handler.is_completed():
                 Recipe.objects.complete(handler.recipe.id, when)
 
-    @transaction.atomic
     def handle_job_failure(self, job_exe_id, when, tasks, error=None):
         """Handles the failure of a job execution. If the job has tries remaining, it is put back on the queue.
         Otherwise it is marked failed. All database changes occur in an atomic transaction.
@@ -391,45 +390,93 @@ class QueueManager(models.Manager):
         :type error: :class:`error.models.Error`
         """
 
+        self.handle_job_failures([job_exe_id], when, {job_exe_id: tasks}, error)
+
+    @transaction.atomic
+    def handle_job_failures(self, job_exe_ids, when, tasks, error=None):
+        """Handles the failure of the job executions with the given IDs. Any job execution that is no longer RUNNING is
+        ignored. Jobs with tries remaining are put back on the queue, the others are marked failed. The job executions
+        are locked and failed with a constant number of queries, though each execution with tasks is also saved
+        individually to capture its task info. All database changes occur in an atomic transaction.
+
+        :param job_exe_ids: The IDs of the job executions that failed
+        :type job_exe_ids: [int]
+        :param when: When the failures occurred
+        :type when: :class:`datetime.datetime`
+        :param tasks: The list of tasks for each job execution, stored by job execution ID (job executions may be
+            omitted if they have no tasks)
+        :type tasks: {int: [:class:`job.execution.running.tasks.base_task.Task`]}
+        :param error: The error that caused the failures
+        :type error: :class:`error.models.Error`
+        """
+
+        if not job_exe_ids:
+            return
+
         if not error:
             error = Error.objects.get_unknown_error()
 
-        job_exe = JobExecution.objects.get_locked_job_exe(job_exe_id)
-        if job_exe.status != 'RUNNING':
-            # If this job execution is no longer running, ignore failure
+        # Lock job executions, ignoring those that are no longer running
+        job_exes = []
+        for job_exe in JobExecution.objects.get_locked_job_exes(job_exe_ids):
+            if job_exe.status == 'RUNNING':
+                job_exes.append(job_exe)
+        if not job_exes:
             return
-        job_exe.job = Job.objects.get_locked_job(job_exe.job_id)
-        for task in tasks:
-            task.populate_job_exe_model(job_exe)
-        JobExecution.objects.update_status([job_exe], 'FAILED', when, error)
+
+        # Lock corresponding jobs
+        jobs = {}
+        for job in Job.objects.get_locked_jobs([job_exe.job_id for job_exe in job_exes]):
+            jobs[job.id] = job
+        job_exes_with_tasks = []
+        for job_exe in job_exes:
+            job_exe.job = jobs[job_exe.job_id]
+            if tasks.get(job_exe.id):
+                for task in tasks[job_exe.id]:
+                    task.populate_job_exe_model(job_exe)
+                job_exes_with_tasks.append(job_exe)
+
+        JobExecution.objects.update_status(job_exes, 'FAILED', when, error)
+
         # TODO: extra save here to capture task info, re-work this as part of the architecture refactor
-        job_exe.save()
+        for job_exe in job_exes_with_tasks:
+            job_exe.save()
 
-        self._handle_job_finished(job_exe)
+        jobs_to_retry = []
+        job_ids_not_retried = []
+        for job_exe in job_exes:
+            self._handle_job_finished(job_exe)
 
-        # Execute any registered processors from other applications
-        for processor_class in self._processors:
-            try:
-                processor = processor_class()
-                processor.process_failed(job_exe)
-            except:
-                logger.exception('Unable to call queue processor for failed job execution: %s -> %s', processor_class,
-                                 job_exe_id)
-
-        # Re-try job if a system error occurred and there are more tries left
-        retry = error.category == 'SYSTEM' and job_exe.job.num_exes < job_exe.job.max_tries
-        # Also re-try long running jobs
-        retry = retry or job_exe.job.job_type.is_long_running
-        # Do not re-try superseded jobs
-        retry = retry and not job_exe.job.is_superseded
-
-        if retry:
-            self._queue_jobs([job_exe.job])
-        else:
-            # If this job is in a recipe, update dependent jobs so that they are BLOCKED
-            handler = Recipe.objects.get_recipe_handler_for_job(job_exe.job_id)
-            if handler:
-                jobs_to_blocked = handler.get_blocked_jobs()
+            # Execute any registered processors from other applications
+            for processor_class in self._processors:
+                try:
+                    processor = processor_class()
+                    processor.process_failed(job_exe)
+                except:
+                    logger.exception('Unable to call queue processor for failed job execution: %s -> %s',
+                                     processor_class, job_exe.id)
+
+            # Re-try job if a system error occurred and there are more tries left
+            retry = error.category == 'SYSTEM' and job_exe.job.num_exes < job_exe.job.max_tries
+            # Also re-try long running jobs
+            retry = retry or job_exe.job.job_type.is_long_running
+            # Do not re-try superseded jobs
+            retry = retry and not job_exe.job.is_superseded
+
+            if retry:
+                jobs_to_retry.append(job_exe.job)
+            else:
+                job_ids_not_retried.append(job_exe.job_id)
+
+        if jobs_to_retry:
+            self._queue_jobs(jobs_to_retry)
+
+        # Update dependent recipe jobs (with model locks) so that they are BLOCKED
+        if job_ids_not_retried:
+            jobs_to_blocked = []
+            for handler in Recipe.objects.get_recipe_handlers_for_jobs(job_ids_not_retried):
+                jobs_to_blocked.extend(handler.get_blocked_jobs())
+            if jobs_to_blocked:
                 Job.objects.update_status(jobs_to_blocked, 'BLOCKED', when)
 
     @transaction.atomic
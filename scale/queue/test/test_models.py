@@ -171,6 +171,66 @@ class TestQueueManager(TransactionTestCase):
         self.assertEqual(job_exe.status, 'FAILED')
         self.assertEqual(job_exe.error_id, unknown_error.id)
 
+    def test_handle_job_failures(self):
+        """Tests calling QueueManager.handle_job_failures() with multiple job executions"""
+
+        job_type_1 = job_test_utils.create_job_type(max_tries=1)
+        job_1 = job_test_utils.create_job(job_type=job_type_1, status='RUNNING', num_exes=1)
+        job_exe_1 = job_test_utils.create_job_exe(job=job_1, status='RUNNING')
+        job_type_2 = job_test_utils.create_job_type(max_tries=2)
+        job_2 = job_test_utils.create_job(job_type=job_type_2, status='RUNNING', num_exes=1)
+        job_exe_2 = job_test_utils.create_job_exe(job=job_2, status='RUNNING')
+        job_exe_3 = job_test_utils.create_job_exe(status='COMPLETED')
+
+        # Call method to test
+        Queue.objects.handle_job_failures([job_exe_1.id, job_exe_2.id, job_exe_3.id], now(), {})
+
+        # Make sure both running executions failed, job 1 failed, job 2 retried, and execution 3 was ignored
+        job_1 = Job.objects.get(pk=job_1.id)
+        job_2 = Job.objects.get(pk=job_2.id)
+        job_exe_1 = JobExecution.objects.get(pk=job_exe_1.id)
+        job_exe_2 = JobExecution.objects.get(pk=job_exe_2.id)
+        job_exe_3 = JobExecution.objects.get(pk=job_exe_3.id)
+        unknown_error = Error.objects.get_unknown_error()
+        self.assertEqual(job_1.status, 'FAILED')
+        self.assertEqual(job_1.error_id, unknown_error.id)
+        self.assertEqual(job_2.status, 'QUEUED')
+        self.assertIsNone(job_2.error)
+        self.assertEqual(job_exe_1.status, 'FAILED')
+        self.assertEqual(job_exe_1.error_id, unknown_error.id)
+        self.assertEqual(job_exe_2.status, 'FAILED')
+        self.assertEqual(job_exe_2.error_id, unknown_error.id)
+        self.assertEqual(job_exe_3.status, 'COMPLETED')
+
+    def test_handle_job_failures_tasks(self):
+        """Tests calling QueueManager.handle_job_failures() with task info for some of the job executions"""
+
+        job_type = job_test_utils.create_job_type(max_tries=1)
+        job_1 = job_test_utils.create_job(job_type=job_type, status='RUNNING', num_exes=1)
+        job_exe_1 = job_test_utils.create_job_exe(job=job_1, status='RUNNING')
+        job_2 = job_test_utils.create_job(job_type=job_type, status='RUNNING', num_exes=1)
+        job_exe_2 = job_test_utils.create_job_exe(job=job_2, status='RUNNING')
+
+        def populate_job_exe_model(job_exe):
+            job_exe.pre_exit_code = 1
+        task = MagicMock()
+        task.populate_job_exe_model.side_effect = populate_job_exe_model
+
+        # Call method to test
+        when = now()
+        Queue.objects.handle_job_failures([job_exe_1.id, job_exe_2.id], when, {job_exe_1.id: [task]})
+
+        # Make sure both executions failed and only execution 1 has task info
+        job_exe_1 = JobExecution.objects.get(pk=job_exe_1.id)
+        job_exe_2 = JobExecution.objects.get(pk=job_exe_2.id)
+        self.assertEqual(task.populate_job_exe_model.call_count, 1)
+        self.assertEqual(job_exe_1.status, 'FAILED')
+        self.assertEqual(job_exe_1.ended, when)
+        self.assertEqual(job_exe_1.pre_exit_code, 1)
+        self.assertEqual(job_exe_2.status, 'FAILED')
+        self.assertEqual(job_exe_2.ended, when)
+        self.assertIsNone(job_exe_2.pre_exit_code)
+
 
 class TestQueueManagerHandleJobCancellation(TransactionTestCase):
 
@@ -27,6 +27,20 @@ MESOS_MASTER = None
 # Zookeeper URL for scheduler leader election. If this is None, only a single scheduler is used.
 SCHEDULER_ZK = None
 
+# Poll intervals in seconds for the scheduler background threads. Each thread polls at its minimum interval while it
+# is finding work and backs off exponentially towards its maximum interval while it is idle. The database sync thread
+# only considers itself idle when there are no running job executions, but it still picks up other database changes
+# (new nodes, job types, pausing, etc), so it defaults to a fixed interval. The scheduling thread is only idle when
+# there are no running or queued job executions.
+SCALE_DB_SYNC_MIN_INTERVAL = 10
+SCALE_DB_SYNC_MAX_INTERVAL = 10
+SCALE_RECON_MIN_INTERVAL = 60
+SCALE_RECON_MAX_INTERVAL = 60
+SCALE_SCHEDULING_MIN_INTERVAL = 5
+SCALE_SCHEDULING_MAX_INTERVAL = 15
+SCALE_STATUS_UPDATE_MIN_INTERVAL = 1
+SCALE_STATUS_UPDATE_MAX_INTERVAL = 1
+
 # The full name for the Scale Docker image (without version tag)
 SCALE_DOCKER_IMAGE = 'geoint/scale'
 
@@ -3,17 +3,13 @@ from __future__ import unicode_literals
 
 import datetime
 import logging
-import threading
+import time
 
-from django.db import DatabaseError
 from django.utils.timezone import now
 from mesos.interface import Scheduler as MesosScheduler
-from mesos.interface import mesos_pb2
 
 from error.models import Error
-from job.execution.running.job_exe import RunningJobExecution
 from job.execution.running.manager import RunningJobExecutionManager
-from job.execution.running.tasks.results import TaskResults
 from job.models import JobExecution
 from job.resources import NodeResources
 from mesos_api import utils
@@ -31,19 +27,25 @@ from scheduler.threads.db_sync import DatabaseSyncThread
 from scheduler.threads.recon import ReconciliationThread
 from scheduler.threads.schedule import SchedulingThread
 from scheduler.threads.status import StatusUpdateThread
+from scheduler.threads.task_handler import TaskHandlerThread
 
 
 logger = logging.getLogger(__name__)
 
+# Names of the offer resources that are used by the scheduler
+RESOURCE_NAMES = frozenset(('cpus', 'mem', 'disk'))
+
 
 class ScaleScheduler(MesosScheduler):
     """Mesos scheduler for the Scale framework"""
 
-    # Warning threshold for normal callbacks (those with no external calls, e.g. database queries)
-    NORMAL_WARN_THRESHOLD = datetime.timedelta(milliseconds=5)
+    # Warning threshold in seconds for normal callbacks (those with no external calls, e.g. database queries)
+    NORMAL_WARN_S = 0.005
+    NORMAL_WARN_THRESHOLD = datetime.timedelta(seconds=NORMAL_WARN_S)
 
-    # Warning threshold for callbacks that include database queries
-    DATABASE_WARN_THRESHOLD = datetime.timedelta(milliseconds=100)
+    # Warning threshold in seconds for callbacks that include database queries
+    DATABASE_WARN_S = 0.1
+    DATABASE_WARN_THRESHOLD = datetime.timedelta(seconds=DATABASE_WARN_S)
 
     def __init__(self):
         """Constructor
@@ -66,6 +68,7 @@ class ScaleScheduler(MesosScheduler):
         self._recon_thread = None
         self._scheduling_thread = None
         self._status_thread = None
+        self._task_handler_thread = None
 
     def registered(self, driver, frameworkId, masterInfo):
         """
@@ -79,13 +82,11 @@ class ScaleScheduler(MesosScheduler):
 
         self._driver = driver
         self._framework_id = frameworkId.value
-        self._master_hostname = masterInfo.hostname
-        self._master_port = masterInfo.port
         logger.info('Scale scheduler registered as framework %s with Mesos master at %s:%i',
-                    self._framework_id, self._master_hostname, self._master_port)
+                    self._framework_id, masterInfo.hostname, masterInfo.port)
 
         initialize_system()
-        Scheduler.objects.update_master(self._master_hostname, self._master_port)
+        self._update_master(masterInfo)
 
         # Initial database sync
         self._job_type_manager.sync_with_database()
@@ -95,26 +96,21 @@ class ScaleScheduler(MesosScheduler):
         # Start up background threads
         self._db_sync_thread = DatabaseSyncThread(self._driver, self._job_exe_manager, self._job_type_manager,
                                                   self._node_manager, self._scheduler_manager, self._workspace_manager)
-        db_sync_thread = threading.Thread(target=self._db_sync_thread.run)
-        db_sync_thread.daemon = True
-        db_sync_thread.start()
+        self._db_sync_thread.start()
 
         self._recon_thread = ReconciliationThread(self._driver)
-        recon_thread = threading.Thread(target=self._recon_thread.run)
-        recon_thread.daemon = True
-        recon_thread.start()
+        self._recon_thread.start()
 
         self._scheduling_thread = SchedulingThread(self._driver, self._framework_id, self._job_exe_manager,
                                                    self._job_type_manager, self._node_manager, self._offer_manager,
                                                    self._scheduler_manager, self._workspace_manager)
-        scheduling_thread = threading.Thread(target=self._scheduling_thread.run)
-        scheduling_thread.daemon = True
-        scheduling_thread.start()
+        self._scheduling_thread.start()
 
         self._status_thread = StatusUpdateThread(self._status_manager)
-        status_thread = threading.Thread(target=self._status_thread.run)
-        status_thread.daemon = True
-        status_thread.start()
+        self._status_thread.start()
+
+        self._task_handler_thread = TaskHandlerThread(self._job_exe_manager, self._recon_thread)
+        self._task_handler_thread.start()
 
         self._reconcile_running_jobs()
 
@@ -129,12 +125,9 @@ class ScaleScheduler(MesosScheduler):
         """
 
         self._driver = driver
-        self._master_hostname = masterInfo.hostname
-        self._master_port = masterInfo.port
-        logger.info('Scale scheduler re-registered with Mesos master at %s:%i',
-                    self._master_hostname, self._master_port)
+        logger.info('Scale scheduler re-registered with Mesos master at %s:%i', masterInfo.hostname, masterInfo.port)
 
-        Scheduler.objects.update_master(self._master_hostname, self._master_port)
+        self._update_master(masterInfo)
 
         # Update driver for background threads
         self._db_sync_thread.driver = self._driver
@@ -175,36 +168,30 @@ class ScaleScheduler(MesosScheduler):
         See documentation for :meth:`mesos_api.mesos.Scheduler.resourceOffers`.
         """
 
-        started = now()
+        started = time.time()
 
-        agent_ids = []
-        resource_offers = []
-        for offer in offers:
-            offer_id = offer.id.value
+        num_offers = len(offers)
+        agent_ids = [None] * num_offers
+        resource_offers = [None] * num_offers
+        node_resources_class = NodeResources
+        resource_offer_class = ResourceOffer
+        for i, offer in enumerate(offers):
             agent_id = offer.slave_id.value
-            disk = 0
-            mem = 0
-            cpus = 0
-            for resource in offer.resources:
-                if resource.name == 'disk':
-                    disk = resource.scalar.value
-                elif resource.name == 'mem':
-                    mem = resource.scalar.value
-                elif resource.name == 'cpus':
-                    cpus = resource.scalar.value
-            resources = NodeResources(cpus=cpus, mem=mem, disk=disk)
-            agent_ids.append(agent_id)
-            resource_offers.append(ResourceOffer(offer_id, agent_id, resources))
+            values = {r.name: r.scalar.value for r in offer.resources if r.name in RESOURCE_NAMES}
+            agent_ids[i] = agent_id
+            resources = node_resources_class(cpus=values.get('cpus', 0), mem=values.get('mem', 0),
+                                             disk=values.get('disk', 0))
+            resource_offers[i] = resource_offer_class(offer.id.value, agent_id, resources)
 
         self._node_manager.add_agent_ids(agent_ids)
         self._offer_manager.add_new_offers(resource_offers)
 
-        duration = now() - started
+        duration = time.time() - started
         msg = 'Scheduler resourceOffers() took %.3f seconds'
-        if duration > ScaleScheduler.NORMAL_WARN_THRESHOLD:
-            logger.warning(msg, duration.total_seconds())
+        if duration > ScaleScheduler.NORMAL_WARN_S:
+            logger.warning(msg, duration)
         else:
-            logger.debug(msg, duration.total_seconds())
+            logger.debug(msg, duration)
 
     def offerRescinded(self, driver, offerId):
         """
@@ -217,17 +204,17 @@ class ScaleScheduler(MesosScheduler):
         See documentation for :meth:`mesos_api.mesos.Scheduler.offerRescinded`.
         """
 
-        started = now()
+        started = time.time()
 
         offer_id = offerId.value
         self._offer_manager.remove_offers([offer_id])
 
-        duration = now() - started
+        duration = time.time() - started
         msg = 'Scheduler offerRescinded() took %.3f seconds'
-        if duration > ScaleScheduler.NORMAL_WARN_THRESHOLD:
-            logger.warning(msg, duration.total_seconds())
+        if duration > ScaleScheduler.NORMAL_WARN_S:
+            logger.warning(msg, duration)
         else:
-            logger.debug(msg, duration.total_seconds())
+            logger.debug(msg, duration)
 
     def statusUpdate(self, driver, status):
         """
@@ -243,53 +230,26 @@ class ScaleScheduler(MesosScheduler):
         See documentation for :meth:`mesos_api.mesos.Scheduler.statusUpdate`.
         """
 
-        started = now()
+        started = time.time()
 
         self._status_manager.add_status_update(status)
         task_id = status.task_id.value
-        job_exe_id = RunningJobExecution.get_job_exe_id(task_id)
-        logger.info('Status update for task %s: %s', task_id, utils.get_status_state(status))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('Status update for task %s: %s', task_id, utils.get_status_state(status))
 
         # Since we have a status update for this task, remove it from reconciliation set
-        self._recon_thread.remove_task_id(task_id)
-
-        try:
-            running_job_exe = self._job_exe_manager.get_job_exe(job_exe_id)
-
-            if running_job_exe:
-                results = TaskResults(task_id)
-                results.exit_code = utils.parse_exit_code(status)
-                results.when = utils.get_status_timestamp(status)
-                # Apply status update to running job execution
-                if status.state == mesos_pb2.TASK_RUNNING:
-                    running_job_exe.task_start(task_id, results.when)
-                elif status.state == mesos_pb2.TASK_FINISHED:
-                    if results.exit_code is None:
-                        results.exit_code = 0
-                    running_job_exe.task_complete(results)
-                elif status.state == mesos_pb2.TASK_LOST:
-                    running_job_exe.task_fail(results, Error.objects.get_builtin_error('mesos-lost'))
-                elif status.state in [mesos_pb2.TASK_ERROR, mesos_pb2.TASK_FAILED, mesos_pb2.TASK_KILLED]:
-                    running_job_exe.task_fail(results)
-
-                # Remove finished job execution
-                if running_job_exe.is_finished():
-                    self._job_exe_manager.remove_job_exe(job_exe_id)
-            else:
-                # Scheduler doesn't have any knowledge of this job execution
-                Queue.objects.handle_job_failure(job_exe_id, now(), [],
-                                                 Error.objects.get_builtin_error('scheduler-lost'))
-        except Exception:
-            logger.exception('Error handling status update for job execution: %s', job_exe_id)
-            # Error handling status update, add task so it can be reconciled
-            self._recon_thread.add_task_ids([task_id])
-
-        duration = now() - started
+        self._recon_thread.remove_task_ids([task_id])
+
+        # Apply the status update to its running job execution in the background
+        self._task_handler_thread.add_task_update(task_id, status.state, utils.parse_exit_code(status),
+                                                  utils.get_status_timestamp(status))
+
+        duration = time.time() - started
         msg = 'Scheduler statusUpdate() took %.3f seconds'
-        if duration > ScaleScheduler.DATABASE_WARN_THRESHOLD:
-            logger.warning(msg, duration.total_seconds())
+        if duration > ScaleScheduler.NORMAL_WARN_S:
+            logger.warning(msg, duration)
         else:
-            logger.debug(msg, duration.total_seconds())
+            logger.debug(msg, duration)
 
     def frameworkMessage(self, driver, executorId, slaveId, message):
         """
@@ -300,7 +260,7 @@ class ScaleScheduler(MesosScheduler):
         See documentation for :meth:`mesos_api.mesos.Scheduler.frameworkMessage`.
         """
 
-        started = now()
+        started = time.time()
 
         agent_id = slaveId.value
         node = self._node_manager.get_node(agent_id)
@@ -310,12 +270,12 @@ class ScaleScheduler(MesosScheduler):
         else:
             logger.info('Message from %s on agent %s: %s', executorId.value, agent_id, message)
 
-        duration = now() - started
+        duration = time.time() - started
         msg = 'Scheduler frameworkMessage() took %.3f seconds'
-        if duration > ScaleScheduler.NORMAL_WARN_THRESHOLD:
-            logger.warning(msg, duration.total_seconds())
+        if duration > ScaleScheduler.NORMAL_WARN_S:
+            logger.warning(msg, duration)
         else:
-            logger.debug(msg, duration.total_seconds())
+            logger.debug(msg, duration)
 
     def slaveLost(self, driver, slaveId):
         """
@@ -326,7 +286,7 @@ class ScaleScheduler(MesosScheduler):
         See documentation for :meth:`mesos_api.mesos.Scheduler.slaveLost`.
         """
 
-        started = now()
+        started = time.time()
 
         agent_id = slaveId.value
         node = self._node_manager.get_node(agent_id)
@@ -341,24 +301,19 @@ class ScaleScheduler(MesosScheduler):
 
         # Fail job executions that were running on the lost node
         if node:
-            for running_job_exe in self._job_exe_manager.get_job_exes_on_node(node.id):
-                try:
-                    running_job_exe.execution_lost(started)
-                except DatabaseError:
-                    logger.exception('Error failing lost job execution: %s', running_job_exe.id)
-                    # Error failing execution, add task so it can be reconciled
-                    task = running_job_exe.current_task
-                    if task:
-                        self._recon_thread.add_task_ids([task.id])
-                if running_job_exe.is_finished():
-                    self._job_exe_manager.remove_job_exe(running_job_exe.id)
-
-        duration = now() - started
+            failed_ids, task_ids = self._job_exe_manager.fail_job_exes_on_node(node.id, now())
+            if failed_ids:
+                logger.info('Failed %i job execution(s) on lost node', len(failed_ids))
+            if task_ids:
+                # Error failing executions, add tasks so they can be reconciled
+                self._recon_thread.add_task_ids(task_ids)
+
+        duration = time.time() - started
         msg = 'Scheduler slaveLost() took %.3f seconds'
-        if duration > ScaleScheduler.DATABASE_WARN_THRESHOLD:
-            logger.warning(msg, duration.total_seconds())
+        if duration > ScaleScheduler.DATABASE_WARN_S:
+            logger.warning(msg, duration)
         else:
-            logger.debug(msg, duration.total_seconds())
+            logger.debug(msg, duration)
 
     def executorLost(self, driver, executorId, slaveId, status):
         """
@@ -368,7 +323,7 @@ class ScaleScheduler(MesosScheduler):
         See documentation for :meth:`mesos_api.mesos.Scheduler.executorLost`.
         """
 
-        started = now()
+        started = time.time()
 
         agent_id = slaveId.value
         node = self._node_manager.get_node(agent_id)
@@ -378,12 +333,12 @@ class ScaleScheduler(MesosScheduler):
         else:
             logger.error('Executor %s lost on agent: %s', executorId.value, agent_id)
 
-        duration = now() - started
+        duration = time.time() - started
         msg = 'Scheduler executorLost() took %.3f seconds'
-        if duration > ScaleScheduler.NORMAL_WARN_THRESHOLD:
-            logger.warning(msg, duration.total_seconds())
+        if duration > ScaleScheduler.NORMAL_WARN_S:
+            logger.warning(msg, duration)
         else:
-            logger.debug(msg, duration.total_seconds())
+            logger.debug(msg, duration)
 
     def error(self, driver, message):
         """
@@ -407,6 +362,7 @@ class ScaleScheduler(MesosScheduler):
         self._recon_thread.shutdown()
         self._scheduling_thread.shutdown()
         self._status_thread.shutdown()
+        self._task_handler_thread.shutdown()
 
     def _reconcile_running_jobs(self):
         """Looks up all currently running jobs in the database and sets them up to be reconciled with Mesos"""
@@ -415,19 +371,38 @@ class ScaleScheduler(MesosScheduler):
         task_ids = []
 
         # Query for job executions that are running
-        job_exes = JobExecution.objects.get_running_job_exes()
+        job_exe_ids = list(JobExecution.objects.get_running_job_exe_ids())
+        running_job_exes = self._job_exe_manager.get_job_exes(job_exe_ids)
 
         # Find current task IDs for running executions
-        for job_exe in job_exes:
-            running_job_exe = self._job_exe_manager.get_job_exe(job_exe.id)
-            if running_job_exe:
-                task = running_job_exe.current_task
+        lost_job_exe_ids = []
+        for job_exe_id in job_exe_ids:
+            if job_exe_id in running_job_exes:
+                task = running_job_exes[job_exe_id].current_task
                 if task:
                     task_ids.append(task.id)
             else:
-                # Fail any executions that the scheduler has lost
-                Queue.objects.handle_job_failure(job_exe.id, now(), [],
-                                                 Error.objects.get_builtin_error('scheduler-lost'))
+                lost_job_exe_ids.append(job_exe_id)
+
+        # Fail any executions that the scheduler has lost
+        if lost_job_exe_ids:
+            error = Error.objects.get_builtin_error('scheduler-lost')
+            Queue.objects.handle_job_failures(lost_job_exe_ids, now(), {}, error)
 
         # Send task IDs to reconciliation thread
         self._recon_thread.add_task_ids(task_ids)
+
+    def _update_master(self, master_info):
+        """Updates the Mesos master location stored in the database, skipping the update if the location is unchanged
+
+        :param master_info: The Mesos master information
+        :type master_info: :class:`mesos_pb2.MasterInfo`
+        """
+
+        if (master_info.hostname, master_info.port) == (self._master_hostname, self._master_port):
+            return
+
+        Scheduler.objects.update_master(master_info.hostname, master_info.port)
+        self._master_hostname = master_info.hostname
+        self._master_port = master_info.port
+        logger.info('Mesos master location updated to %s:%i', self._master_hostname, self._master_port)
@@ -66,6 +66,8 @@ class StatusManager(object):
         if models:
             self._bulk_save(models)
 
+        return total_count
+
     @retry_database_query
     def _bulk_save(self, models):
         """Performs a bulk save of the given task update models
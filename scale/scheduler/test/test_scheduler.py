@@ -21,10 +21,8 @@ class TestScheduler(TransactionTestCase):
     def setUp(self):
         django.setup()
 
-        #mock out threading.start
-
     @patch('scheduler.scale_scheduler.initialize_system')
-    @patch('scheduler.scale_scheduler.threading.Thread.start')
+    @patch('threading.Thread.start')
     def _get_mocked_scheduler_driver_master(self, _m1, _m2):
         '''gets a registered scheduler with some stuff mocked out for testing'''
         return self._get_registered_scheduler_driver_master()
@@ -42,12 +40,12 @@ class TestScheduler(TransactionTestCase):
         return my_scheduler, driver, master_info
 
     @patch('scheduler.scale_scheduler.initialize_system')
-    @patch('scheduler.scale_scheduler.threading.Thread.start')
+    @patch('threading.Thread.start')
     def testRegistration(self, mock_thread_start, mock_initializer):
         my_scheduler, driver, master_info = self._get_registered_scheduler_driver_master()
         self.assertTrue(mock_initializer.called,'initializer should be called on registration')
-        self.assertEqual(mock_thread_start.call_count, 4,
-                        'reconciliation and job kill threads should be started (4 != %d)' % mock_thread_start.call_count)
+        self.assertEqual(mock_thread_start.call_count, 5,
+                        'all background threads should be started (5 != %d)' % mock_thread_start.call_count)
 
     @patch('scheduler.scale_scheduler.ScaleScheduler._reconcile_running_jobs')
     def test_reregistration_triggers_reconciliation(self, mock_reconcile_running_jobs):
@@ -58,7 +56,70 @@ class TestScheduler(TransactionTestCase):
         self.assertEqual(reconcile_calls_after - reconcile_calls_before, 1,
                          're-registering the scheduler should trigger a call to reconcile running jobs')
 
-    '''TODO: add more tests, perhaps these:    
+    @patch('scheduler.scale_scheduler.ScaleScheduler._reconcile_running_jobs')
+    @patch('scheduler.scale_scheduler.Scheduler.objects.update_master')
+    def test_reregistration_same_master(self, mock_update_master, mock_reconcile_running_jobs):
+        my_scheduler, driver, master_info = self._get_mocked_scheduler_driver_master()
+        update_calls_before = mock_update_master.call_count
+        my_scheduler.reregistered(driver, master_info)
+        self.assertEqual(mock_update_master.call_count, update_calls_before,
+                         're-registering with the same master should not update the database')
+
+        master_info.hostname = 'otherhost'
+        my_scheduler.reregistered(driver, master_info)
+        mock_update_master.assert_called_with('otherhost', 1234)
+
+    @patch('scheduler.scale_scheduler.Error.objects.get_builtin_error')
+    @patch('scheduler.scale_scheduler.Queue.objects.handle_job_failures')
+    @patch('scheduler.scale_scheduler.JobExecution.objects.get_running_job_exe_ids')
+    def test_reconcile_running_jobs(self, mock_get_running_job_exe_ids, mock_handle_job_failures,
+                                    mock_get_builtin_error):
+        '''Tests reconciling running job executions that are known and unknown to the scheduler'''
+        my_scheduler, driver, master_info = self._get_mocked_scheduler_driver_master()
+        my_scheduler._recon_thread = MagicMock()
+        job_exe_1 = MagicMock()
+        job_exe_1.id = 1
+        job_exe_1.current_task.id = 'task_1'
+        job_exe_2 = MagicMock()
+        job_exe_2.id = 2
+        job_exe_2.current_task = None
+        my_scheduler._job_exe_manager.add_job_exes([job_exe_1, job_exe_2])
+        mock_get_running_job_exe_ids.return_value = iter([1, 2, 3, 4])
+
+        my_scheduler._reconcile_running_jobs()
+
+        my_scheduler._recon_thread.add_task_ids.assert_called_once_with(['task_1'])
+        mock_get_builtin_error.assert_called_once_with('scheduler-lost')
+        self.assertEqual(mock_handle_job_failures.call_count, 1)
+        args = mock_handle_job_failures.call_args[0]
+        self.assertListEqual(args[0], [3, 4])
+        self.assertDictEqual(args[2], {})
+        self.assertEqual(args[3], mock_get_builtin_error.return_value)
+
+    @patch('scheduler.scale_scheduler.utils.get_status_timestamp')
+    @patch('scheduler.scale_scheduler.utils.parse_exit_code')
+    @patch('scheduler.scale_scheduler.Queue')
+    def test_status_update(self, mock_queue, mock_parse_exit_code, mock_get_status_timestamp):
+        '''Tests that a status update is handed off to the task handler thread without any database calls'''
+        my_scheduler, driver, master_info = self._get_mocked_scheduler_driver_master()
+        my_scheduler._recon_thread = MagicMock()
+        my_scheduler._task_handler_thread = MagicMock()
+        mock_parse_exit_code.return_value = 1
+        mock_get_status_timestamp.return_value = 'timestamp'
+        status = MagicMock()
+        status.task_id.value = '1_job'
+        status.state = 'state'
+
+        with self.assertNumQueries(0):
+            my_scheduler.statusUpdate(driver, status)
+
+        my_scheduler._recon_thread.remove_task_ids.assert_called_once_with(['1_job'])
+        my_scheduler._task_handler_thread.add_task_update.assert_called_once_with('1_job', 'state', 1, 'timestamp')
+        mock_parse_exit_code.assert_called_once_with(status)
+        mock_get_status_timestamp.assert_called_once_with(status)
+        self.assertListEqual(mock_queue.mock_calls, [])
+
+    '''TODO: add more tests, perhaps these:
     def test_resource_offers_updates_nodes(self):
         pass
 
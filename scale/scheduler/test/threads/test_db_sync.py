@@ -0,0 +1,61 @@
+from __future__ import unicode_literals
+
+import threading
+
+import django
+from django.test import TestCase
+from django.utils.timezone import now
+from mock import MagicMock, patch
+
+from scheduler.threads.db_sync import DatabaseSyncThread
+
+
+class TestDatabaseSyncThread(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self._db_sync_thread = DatabaseSyncThread(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+                                                  MagicMock())
+        self._db_sync_thread._min_interval = 10
+        self._db_sync_thread._max_interval = 30
+
+    @patch('scheduler.threads.db_sync.now')
+    def test_run_backoff(self, mock_now):
+        """Tests that the thread backs off while idle and resets to its minimum interval once it finds work"""
+
+        mock_now.return_value = now()
+        results = [False, False, False, True, False]
+        self._db_sync_thread._perform_sync = MagicMock(side_effect=results)
+        self._db_sync_thread._shutdown_event = MagicMock()
+        self._db_sync_thread._shutdown_event.is_set.side_effect = [False] * len(results) + [True]
+
+        self._db_sync_thread.run()
+
+        intervals = [wait_call[0][0] for wait_call in self._db_sync_thread._shutdown_event.wait.call_args_list]
+        self.assertListEqual(intervals, [20, 30, 30, 10, 20])
+
+    def test_run_error(self):
+        """Tests that the thread polls at its minimum interval after an unexpected error"""
+
+        self._db_sync_thread._perform_sync = MagicMock(side_effect=Exception('Test error'))
+        self._db_sync_thread._shutdown_event = MagicMock()
+        self._db_sync_thread._shutdown_event.is_set.side_effect = [False, True]
+
+        self._db_sync_thread.run()
+
+        self.assertAlmostEqual(self._db_sync_thread._shutdown_event.wait.call_args[0][0], 10, places=0)
+
+    def test_shutdown_wakes_thread(self):
+        """Tests that shutting down the thread wakes it up early from its interval"""
+
+        sync_called = threading.Event()
+        self._db_sync_thread._max_interval = 60
+        self._db_sync_thread._perform_sync = MagicMock(side_effect=lambda: sync_called.set())
+
+        self._db_sync_thread.start()
+        self.assertTrue(sync_called.wait(5))
+        self._db_sync_thread.shutdown()
+        self._db_sync_thread.join(5)
+
+        self.assertFalse(self._db_sync_thread.is_alive())
@@ -0,0 +1,48 @@
+from __future__ import unicode_literals
+
+import threading
+
+import django
+from django.test import TestCase
+from django.utils.timezone import now
+from mock import MagicMock, patch
+
+from scheduler.threads.recon import ReconciliationThread
+
+
+class TestReconciliationThread(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self._recon_thread = ReconciliationThread(MagicMock())
+        self._recon_thread._min_interval = 60
+        self._recon_thread._max_interval = 240
+
+    @patch('scheduler.threads.recon.now')
+    def test_run_backoff(self, mock_now):
+        """Tests that the thread backs off while idle and resets to its minimum interval once it finds work"""
+
+        mock_now.return_value = now()
+        results = [False, False, False, True, False]
+        self._recon_thread._perform_reconciliation = MagicMock(side_effect=results)
+        self._recon_thread._shutdown_event = MagicMock()
+        self._recon_thread._shutdown_event.is_set.side_effect = [False] * len(results) + [True]
+
+        self._recon_thread.run()
+
+        intervals = [wait_call[0][0] for wait_call in self._recon_thread._shutdown_event.wait.call_args_list]
+        self.assertListEqual(intervals, [120, 240, 240, 60, 120])
+
+    def test_shutdown_wakes_thread(self):
+        """Tests that shutting down the thread wakes it up early from its interval"""
+
+        recon_called = threading.Event()
+        self._recon_thread._perform_reconciliation = MagicMock(side_effect=lambda: recon_called.set())
+
+        self._recon_thread.start()
+        self.assertTrue(recon_called.wait(5))
+        self._recon_thread.shutdown()
+        self._recon_thread.join(5)
+
+        self.assertFalse(self._recon_thread.is_alive())
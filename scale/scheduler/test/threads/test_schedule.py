@@ -1,5 +1,7 @@
 from __future__ import unicode_literals
 
+import threading
+
 import django
 from django.test import TransactionTestCase
 from mock import MagicMock, patch
@@ -111,3 +113,71 @@ class TestSchedulingThread(TransactionTestCase):
 
         num_tasks = self._scheduling_thread._perform_scheduling()
         self.assertEqual(num_tasks, 3)  # One is already running, should only be able to schedule 3 more
+
+    def test_run_backoff(self):
+        """Tests that the thread backs off while idle and resets to its minimum interval once it schedules tasks"""
+
+        results = [0, 0, 0, 2, 0]
+        self._scheduling_thread._perform_scheduling = MagicMock(side_effect=results)
+        self._scheduling_thread._shutdown_event = MagicMock()
+        self._scheduling_thread._shutdown_event.is_set.side_effect = [False] * len(results) + [True]
+        self._scheduling_thread._min_interval = 5
+        self._scheduling_thread._max_interval = 15
+
+        self._scheduling_thread.run()
+
+        intervals = [wait_call[0][0] for wait_call in self._scheduling_thread._shutdown_event.wait.call_args_list]
+        self.assertListEqual(intervals, [5, 10, 15, 5])
+
+    def test_run_no_backoff_with_running_job_exes(self):
+        """Tests that the thread does not back off while there are running job executions"""
+
+        running_job_exe = MagicMock()
+        running_job_exe.id = 1
+        self._job_exe_manager.add_job_exes([running_job_exe])
+        results = [0, 0, 0]
+        self._scheduling_thread._perform_scheduling = MagicMock(side_effect=results)
+        self._scheduling_thread._shutdown_event = MagicMock()
+        self._scheduling_thread._shutdown_event.is_set.side_effect = [False] * len(results) + [True]
+        self._scheduling_thread._min_interval = 5
+        self._scheduling_thread._max_interval = 15
+
+        self._scheduling_thread.run()
+
+        intervals = [wait_call[0][0] for wait_call in self._scheduling_thread._shutdown_event.wait.call_args_list]
+        self.assertListEqual(intervals, [5, 5, 5])
+
+    @patch('mesos_api.tasks.mesos_pb2.TaskInfo')
+    def test_run_no_backoff_with_queued_job_exes(self, mock_taskinfo):
+        """Tests that the thread does not back off while queued job executions are waiting for resources"""
+        mock_taskinfo.return_value = MagicMock()
+
+        # No offers, so the queued job executions cannot be scheduled
+        self._scheduling_thread._shutdown_event = MagicMock()
+        self._scheduling_thread._shutdown_event.is_set.side_effect = [False, False, False, True]
+        self._scheduling_thread._min_interval = 5
+        self._scheduling_thread._max_interval = 15
+
+        self._scheduling_thread.run()
+
+        intervals = [wait_call[0][0] for wait_call in self._scheduling_thread._shutdown_event.wait.call_args_list]
+        self.assertListEqual(intervals, [5, 5, 5])
+
+    def test_shutdown_wakes_thread(self):
+        """Tests that shutting down the thread wakes it up early from its interval"""
+
+        schedule_called = threading.Event()
+
+        def perform_scheduling():
+            schedule_called.set()
+            return 0
+        self._scheduling_thread._perform_scheduling = MagicMock(side_effect=perform_scheduling)
+        self._scheduling_thread._min_interval = 30
+        self._scheduling_thread._max_interval = 60
+
+        self._scheduling_thread.start()
+        self.assertTrue(schedule_called.wait(5))
+        self._scheduling_thread.shutdown()
+        self._scheduling_thread.join(5)
+
+        self.assertFalse(self._scheduling_thread.is_alive())
@@ -0,0 +1,55 @@
+from __future__ import unicode_literals
+
+import threading
+
+import django
+from django.test import TestCase
+from django.utils.timezone import now
+from mock import MagicMock, patch
+
+from scheduler.threads.status import StatusUpdateThread
+
+
+class TestStatusUpdateThread(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self._status_manager = MagicMock()
+        self._status_thread = StatusUpdateThread(self._status_manager)
+        self._status_thread._min_interval = 1
+        self._status_thread._max_interval = 4
+
+    @patch('scheduler.threads.status.now')
+    def test_run_backoff(self, mock_now):
+        """Tests that the thread backs off while idle and resets to its minimum interval once it finds work"""
+
+        mock_now.return_value = now()
+        results = [0, 0, 0, 5, 0]
+        self._status_manager.push_to_database.side_effect = results
+        self._status_thread._shutdown_event = MagicMock()
+        self._status_thread._shutdown_event.is_set.side_effect = [False] * len(results) + [True]
+
+        self._status_thread.run()
+
+        intervals = [wait_call[0][0] for wait_call in self._status_thread._shutdown_event.wait.call_args_list]
+        self.assertListEqual(intervals, [2, 4, 4, 1, 2])
+
+    def test_shutdown_wakes_thread(self):
+        """Tests that shutting down the thread wakes it up early from its interval"""
+
+        push_called = threading.Event()
+        self._status_thread._min_interval = 30
+        self._status_thread._max_interval = 60
+
+        def push_to_database():
+            push_called.set()
+            return 0
+        self._status_manager.push_to_database.side_effect = push_to_database
+
+        self._status_thread.start()
+        self.assertTrue(push_called.wait(5))
+        self._status_thread.shutdown()
+        self._status_thread.join(5)
+
+        self.assertFalse(self._status_thread.is_alive())
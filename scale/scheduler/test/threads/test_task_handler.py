@@ -0,0 +1,91 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+from django.utils.timezone import now
+from mock import MagicMock, patch
+from mesos.interface import mesos_pb2
+
+from scheduler.threads.task_handler import TaskHandlerThread
+
+
+class TestTaskHandlerThread(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self._job_exe_manager = MagicMock()
+        self._recon_thread = MagicMock()
+        self._running_job_exe = MagicMock()
+        self._running_job_exe.id = 1
+        self._running_job_exe.is_finished.return_value = False
+        self._job_exe_manager.get_job_exe.return_value = self._running_job_exe
+
+        self._task_handler_thread = TaskHandlerThread(self._job_exe_manager, self._recon_thread)
+
+    def test_task_running(self):
+        """Tests handling a TASK_RUNNING update"""
+
+        when = now()
+        task_ids = self._task_handler_thread._handle_task_updates([('1_job', mesos_pb2.TASK_RUNNING, None, when)])
+
+        self.assertListEqual(task_ids, [])
+        self._job_exe_manager.get_job_exe.assert_called_with(1)
+        self._running_job_exe.task_start.assert_called_with('1_job', when)
+        self.assertFalse(self._job_exe_manager.remove_job_exe.called)
+
+    def test_task_finished(self):
+        """Tests handling a TASK_FINISHED update that finishes the job execution"""
+
+        self._running_job_exe.is_finished.return_value = True
+        self._task_handler_thread._handle_task_updates([('1_job', mesos_pb2.TASK_FINISHED, None, now())])
+
+        results = self._running_job_exe.task_complete.call_args[0][0]
+        self.assertEqual(results.task_id, '1_job')
+        self.assertEqual(results.exit_code, 0)
+        self._job_exe_manager.remove_job_exe.assert_called_with(1)
+
+    def test_task_error(self):
+        """Tests that a task is returned for reconciliation when applying its update fails"""
+
+        self._running_job_exe.task_start.side_effect = Exception('Test error')
+        task_ids = self._task_handler_thread._handle_task_updates([('1_job', mesos_pb2.TASK_RUNNING, None, now())])
+
+        self.assertListEqual(task_ids, ['1_job'])
+
+    def test_invalid_task_id(self):
+        """Tests that an update with an unexpected task ID is reconciled without stopping the other updates"""
+
+        when = now()
+        task_updates = [('bad_task', mesos_pb2.TASK_RUNNING, None, when), ('1_job', mesos_pb2.TASK_RUNNING, None, when)]
+        task_ids = self._task_handler_thread._handle_task_updates(task_updates)
+
+        self.assertListEqual(task_ids, ['bad_task'])
+        self._running_job_exe.task_start.assert_called_with('1_job', when)
+
+    @patch('scheduler.threads.task_handler.Error.objects.get_builtin_error')
+    @patch('scheduler.threads.task_handler.Queue.objects.handle_job_failures')
+    def test_lost_job_exes(self, mock_handle_job_failures, mock_get_builtin_error):
+        """Tests that updates for unknown job executions are failed together in one call"""
+
+        self._job_exe_manager.get_job_exe.return_value = None
+        task_updates = [('1_job', mesos_pb2.TASK_RUNNING, None, now()), ('2_job', mesos_pb2.TASK_FAILED, 1, now())]
+        task_ids = self._task_handler_thread._handle_task_updates(task_updates)
+
+        self.assertListEqual(task_ids, [])
+        self.assertEqual(mock_handle_job_failures.call_count, 1)
+        self.assertSetEqual(set(mock_handle_job_failures.call_args[0][0]), {1, 2})
+
+    def test_run_reconciles_on_critical_error(self):
+        """Tests that the tasks of a pass are added for reconciliation when the pass hits an unexpected error"""
+
+        def handle_task_updates(task_updates):
+            self._task_handler_thread.shutdown()
+            raise Exception('Test error')
+
+        self._task_handler_thread._handle_task_updates = MagicMock(side_effect=handle_task_updates)
+        self._task_handler_thread.add_task_update('1_job', mesos_pb2.TASK_RUNNING, None, now())
+        self._task_handler_thread.add_task_update('2_job', mesos_pb2.TASK_RUNNING, None, now())
+        self._task_handler_thread.run()
+
+        self._recon_thread.add_task_ids.assert_called_with(['1_job', '2_job'])
@@ -2,9 +2,9 @@
 from __future__ import unicode_literals
 
 import logging
-import math
-import time
+import threading
 
+from django.conf import settings
 from django.db import DatabaseError
 from django.utils.timezone import now
 from mesos.interface import mesos_pb2
@@ -15,11 +15,9 @@ from job.models import JobExecution
 logger = logging.getLogger(__name__)
 
 
-class DatabaseSyncThread(object):
+class DatabaseSyncThread(threading.Thread):
     """This class manages the database sync background thread for the scheduler"""
 
-    THROTTLE = 10  # seconds
-
     def __init__(self, driver, job_exe_manager, job_type_manager, node_manager, scheduler_manager, workspace_manager):
         """Constructor
 
@@ -37,13 +35,18 @@ class DatabaseSyncThread(object):
         :type workspace_manager: :class:`scheduler.sync.workspace_manager.WorkspaceManager`
         """
 
+        super(DatabaseSyncThread, self).__init__()
+        self.daemon = True
+
         self._driver = driver
         self._job_exe_manager = job_exe_manager
         self._job_type_manager = job_type_manager
         self._node_manager = node_manager
         self._scheduler_manager = scheduler_manager
         self._workspace_manager = workspace_manager
-        self._running = True
+        self._min_interval = settings.SCALE_DB_SYNC_MIN_INTERVAL
+        self._max_interval = settings.SCALE_DB_SYNC_MAX_INTERVAL
+        self._shutdown_event = threading.Event()
 
     @property
     def driver(self):
@@ -71,23 +74,30 @@ class DatabaseSyncThread(object):
 
         logger.info('Database sync thread started')
 
-        while self._running:
+        interval = self._min_interval
+        while not self._shutdown_event.is_set():
 
             started = now()
 
+            has_work = True
             try:
-                self._perform_sync()
+                has_work = self._perform_sync()
             except Exception:
                 logger.exception('Critical error in database sync thread')
 
             ended = now()
             secs_passed = (ended - started).total_seconds()
 
-            # If time takes less than a minute, throttle
-            if secs_passed < DatabaseSyncThread.THROTTLE:
-                # Delay until full throttle time reached
-                delay = math.ceil(DatabaseSyncThread.THROTTLE - secs_passed)
-                time.sleep(delay)
+            # Poll quickly while there are running job executions, otherwise back off
+            if has_work:
+                interval = self._min_interval
+            else:
+                interval = min(interval * 2, self._max_interval)
+
+            # If time takes less than the interval, throttle
+            if secs_passed < interval:
+                # Delay until full interval reached, waking up early on shutdown
+                self._shutdown_event.wait(interval - secs_passed)
 
         logger.info('Database sync thread stopped')
 
@@ -96,10 +106,13 @@ class DatabaseSyncThread(object):
         """
 
         logger.info('Shutting down database sync thread')
-        self._running = False
+        self._shutdown_event.set()
 
     def _perform_sync(self):
         """Performs the sync with the database
+
+        :returns: True if there were running job executions to sync, False otherwise
+        :rtype: bool
         """
 
         self._scheduler_manager.sync_with_database()
@@ -109,15 +122,20 @@ class DatabaseSyncThread(object):
         scheduler = self._scheduler_manager.get_scheduler()
         self._node_manager.sync_with_database(scheduler.master_hostname, scheduler.master_port)
 
-        self._sync_running_job_executions()
+        return self._sync_running_job_executions()
 
     def _sync_running_job_executions(self):
         """Syncs job executions that are currently running by handling any canceled or timed out executions
+
+        :returns: True if there were running job executions to sync, False otherwise
+        :rtype: bool
         """
 
         running_job_exes = {}
         for job_exe in self._job_exe_manager.get_all_job_exes():
             running_job_exes[job_exe.id] = job_exe
+        if not running_job_exes:
+            return False
 
         right_now = now()
 
@@ -144,3 +162,5 @@ class DatabaseSyncThread(object):
 
             if running_job_exe.is_finished():
                 self._job_exe_manager.remove_job_exe(running_job_exe.id)
+
+        return True
@@ -2,10 +2,9 @@
 from __future__ import unicode_literals
 
 import logging
-import math
 import threading
-import time
 
+from django.conf import settings
 from django.utils.timezone import now
 from mesos.interface import mesos_pb2
 
@@ -13,11 +12,9 @@ from mesos.interface import mesos_pb2
 logger = logging.getLogger(__name__)
 
 
-class ReconciliationThread(object):
+class ReconciliationThread(threading.Thread):
     """This class manages the reconciliation background thread for the scheduler"""
 
-    THROTTLE = 60  # seconds
-
     def __init__(self, driver):
         """Constructor
 
@@ -25,9 +22,14 @@ class ReconciliationThread(object):
         :type driver: :class:`mesos_api.mesos.SchedulerDriver`
         """
 
+        super(ReconciliationThread, self).__init__()
+        self.daemon = True
+
         self._driver = driver
         self._lock = threading.Lock()
-        self._running = True
+        self._min_interval = settings.SCALE_RECON_MIN_INTERVAL
+        self._max_interval = settings.SCALE_RECON_MAX_INTERVAL
+        self._shutdown_event = threading.Event()
         self._task_ids_to_reconcile = set()
 
     @property
@@ -57,19 +59,24 @@ class ReconciliationThread(object):
         :type task_ids: [str]
         """
 
+        if not task_ids:
+            return
+
         with self._lock:
-            for task_id in task_ids:
-                self._task_ids_to_reconcile.add(task_id)
+            self._task_ids_to_reconcile.update(task_ids)
 
-    def remove_task_id(self, task_id):
-        """Removes the task ID from the reconciliation set
+    def remove_task_ids(self, task_ids):
+        """Removes a list of task IDs from the reconciliation set
 
-        :param task_id: The task ID to remove
-        :type task_id: str
+        :param task_ids: The list of task IDs to remove
+        :type task_ids: [str]
         """
 
+        if not task_ids:
+            return
+
         with self._lock:
-            self._task_ids_to_reconcile.discard(task_id)
+            self._task_ids_to_reconcile.difference_update(task_ids)
 
     def run(self):
         """The main run loop of the thread
@@ -77,23 +84,30 @@ class ReconciliationThread(object):
 
         logger.info('Reconciliation thread started')
 
-        while self._running:
+        interval = self._min_interval
+        while not self._shutdown_event.is_set():
 
             started = now()
 
+            has_work = True
             try:
-                self._perform_reconciliation()
+                has_work = self._perform_reconciliation()
             except Exception:
                 logger.exception('Critical error in reconciliation thread')
 
             ended = now()
             secs_passed = (ended - started).total_seconds()
 
-            # If time takes less than a minute, throttle
-            if secs_passed < ReconciliationThread.THROTTLE:
-                # Delay until full throttle time reached
-                delay = math.ceil(ReconciliationThread.THROTTLE - secs_passed)
-                time.sleep(delay)
+            # Poll quickly while there are tasks to reconcile, otherwise back off
+            if has_work:
+                interval = self._min_interval
+            else:
+                interval = min(interval * 2, self._max_interval)
+
+            # If time takes less than the interval, throttle
+            if secs_passed < interval:
+                # Delay until full interval reached, waking up early on shutdown
+                self._shutdown_event.wait(interval - secs_passed)
 
         logger.info('Reconciliation thread stopped')
 
@@ -102,19 +116,20 @@ class ReconciliationThread(object):
         """
 
         logger.info('Shutting down reconciliation thread')
-        self._running = False
+        self._shutdown_event.set()
 
     def _perform_reconciliation(self):
         """Performs task reconciliation with the Mesos master
+
+        :returns: True if there were tasks to reconcile, False otherwise
+        :rtype: bool
         """
 
-        task_ids_to_reconcile = []
         with self._lock:
-            for task_id in self._task_ids_to_reconcile:
-                task_ids_to_reconcile.append(task_id)
+            task_ids_to_reconcile = list(self._task_ids_to_reconcile)
 
         if not task_ids_to_reconcile:
-            return
+            return False
 
         logger.info('Asking Mesos to reconcile %i task(s)', len(task_ids_to_reconcile))
         tasks = []
@@ -125,3 +140,4 @@ class ReconciliationThread(object):
             # TODO: adding task.slave_id would be useful if possible
             tasks.append(task)
         self._driver.reconcileTasks(tasks)
+        return True
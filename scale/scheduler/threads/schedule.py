@@ -3,8 +3,9 @@ from __future__ import unicode_literals
 
 import datetime
 import logging
-import time
+import threading
 
+from django.conf import settings
 from django.db import OperationalError
 from django.utils.timezone import now
 from mesos.interface import mesos_pb2
@@ -19,10 +20,9 @@ from util.retry import retry_database_query
 logger = logging.getLogger(__name__)
 
 
-class SchedulingThread(object):
+class SchedulingThread(threading.Thread):
     """This class manages the scheduling background thread for the scheduler"""
 
-    DELAY = 5  # In seconds
     MAX_NEW_JOB_EXES = 500  # Maximum number of new job executions to schedule per scheduling loop
     SCHEDULE_LOOP_WARN_THRESHOLD = datetime.timedelta(seconds=1)
     SCHEDULE_QUERY_WARN_THRESHOLD = datetime.timedelta(milliseconds=100)
@@ -49,6 +49,9 @@ class SchedulingThread(object):
         :type workspace_manager: :class:`scheduler.sync.workspace_manager.WorkspaceManager`
         """
 
+        super(SchedulingThread, self).__init__()
+        self.daemon = True
+
         self._driver = driver
         self._framework_id = framework_id
         self._job_exe_manager = job_exe_manager
@@ -59,7 +62,10 @@ class SchedulingThread(object):
         self._workspace_manager = workspace_manager
         self._job_types = {}  # {Job Type ID: Job Type}
         self._job_type_limit_available = {}  # {Job Type ID: Number still available to be scheduled}
-        self._running = True
+        self._has_queued_job_exes = False  # Whether the last scheduling loop found any queued job executions
+        self._min_interval = settings.SCALE_SCHEDULING_MIN_INTERVAL
+        self._max_interval = settings.SCALE_SCHEDULING_MAX_INTERVAL
+        self._shutdown_event = threading.Event()
 
     @property
     def driver(self):
@@ -87,7 +93,8 @@ class SchedulingThread(object):
 
         logger.info('Scheduling thread started')
 
-        while self._running:
+        interval = self._min_interval
+        while not self._shutdown_event.is_set():
 
             started = now()
 
@@ -105,15 +112,22 @@ class SchedulingThread(object):
                 logger.debug(msg, duration.total_seconds())
 
             if num_tasks == 0:
-                # Since we didn't schedule anything, give resources back to Mesos and pause a moment
+                # Since we didn't schedule anything, give resources back to Mesos and pause, backing off while idle
                 for node_offers in self._offer_manager.pop_all_offers():
                     for offer_id in node_offers.offer_ids:
                         mesos_offer_id = mesos_pb2.OfferID()
                         mesos_offer_id.value = offer_id
                         self._driver.declineOffer(mesos_offer_id)
 
-                logger.debug('Scheduling thread is pausing for %i second(s)', SchedulingThread.DELAY)
-                time.sleep(SchedulingThread.DELAY)
+                logger.debug('Scheduling thread is pausing for %i second(s)', interval)
+                self._shutdown_event.wait(interval)
+                # Only back off while idle, a busy system needs to keep launching next tasks and queued jobs quickly
+                if self._is_idle():
+                    interval = min(interval * 2, self._max_interval)
+                else:
+                    interval = self._min_interval
+            else:
+                interval = self._min_interval
 
         logger.info('Scheduling thread stopped')
 
@@ -122,17 +136,19 @@ class SchedulingThread(object):
         """
 
         logger.info('Shutting down scheduling thread')
-        self._running = False
+        self._shutdown_event.set()
 
     def _consider_new_job_exes(self):
         """Considers any queued job executions for scheduling
         """
 
+        self._has_queued_job_exes = False
         if self._scheduler_manager.is_paused():
             return
 
         num_job_exes = 0
         for queue in Queue.objects.get_queue():
+            self._has_queued_job_exes = True
             job_type_id = queue.job_type_id
 
             if job_type_id not in self._job_types or self._job_types[job_type_id].is_paused:
@@ -156,6 +172,16 @@ class SchedulingThread(object):
         for running_job_exe in self._job_exe_manager.get_ready_job_exes():
             self._offer_manager.consider_next_task(running_job_exe)
 
+    def _is_idle(self):
+        """Indicates whether the scheduler is idle, meaning that there are no running job executions and no queued job
+        executions were found during the last scheduling loop
+
+        :returns: True if the scheduler is idle, False otherwise
+        :rtype: bool
+        """
+
+        return not self._has_queued_job_exes and not self._job_exe_manager.get_all_job_exes()
+
     def _perform_scheduling(self):
         """Performs task reconciliation with the Mesos master
 
@@ -2,20 +2,18 @@
 from __future__ import unicode_literals
 
 import logging
-import math
-import time
+import threading
 
+from django.conf import settings
 from django.utils.timezone import now
 
 
 logger = logging.getLogger(__name__)
 
 
-class StatusUpdateThread(object):
+class StatusUpdateThread(threading.Thread):
     """This class manages the status update background thread for the scheduler"""
 
-    THROTTLE = 1  # seconds
-
     def __init__(self, status_manager):
         """Constructor
 
@@ -23,8 +21,13 @@ class StatusUpdateThread(object):
         :type status_manager: :class:`scheduler.status.manager.StatusManager`
         """
 
+        super(StatusUpdateThread, self).__init__()
+        self.daemon = True
+
         self._status_manager = status_manager
-        self._running = True
+        self._min_interval = settings.SCALE_STATUS_UPDATE_MIN_INTERVAL
+        self._max_interval = settings.SCALE_STATUS_UPDATE_MAX_INTERVAL
+        self._shutdown_event = threading.Event()
 
     def run(self):
         """The main run loop of the thread
@@ -32,23 +35,30 @@ class StatusUpdateThread(object):
 
         logger.info('Status update thread started')
 
-        while self._running:
+        interval = self._min_interval
+        while not self._shutdown_event.is_set():
 
             started = now()
 
+            has_work = True
             try:
-                self._status_manager.push_to_database()
+                has_work = self._status_manager.push_to_database() > 0
             except Exception:
                 logger.exception('Critical error in status update thread')
 
             ended = now()
             secs_passed = (ended - started).total_seconds()
 
-            # If time takes less than threshold, throttle
-            if secs_passed < StatusUpdateThread.THROTTLE:
-                # Delay until full throttle time reached
-                delay = math.ceil(StatusUpdateThread.THROTTLE - secs_passed)
-                time.sleep(delay)
+            # Poll quickly while there are status updates to push, otherwise back off
+            if has_work:
+                interval = self._min_interval
+            else:
+                interval = min(interval * 2, self._max_interval)
+
+            # If time takes less than the interval, throttle
+            if secs_passed < interval:
+                # Delay until full interval reached, waking up early on shutdown
+                self._shutdown_event.wait(interval - secs_passed)
 
         logger.info('Status update thread stopped')
 
@@ -57,4 +67,4 @@ class StatusUpdateThread(object):
         """
 
         logger.info('Shutting down status update thread')
-        self._running = False
+        self._shutdown_event.set()
@@ -0,0 +1,220 @@
+"""Defines the class that manages the task handler background thread"""
+from __future__ import unicode_literals
+
+import logging
+import threading
+
+from django.utils.timezone import now
+from mesos.interface import mesos_pb2
+
+from error.models import Error
+from job.execution.running.job_exe import RunningJobExecution
+from job.execution.running.tasks.results import TaskResults
+from queue.models import Queue
+
+
+logger = logging.getLogger(__name__)
+
+
+def _task_finished(running_job_exe, results):
+    """Completes the task of the given results, defaulting to a zero exit code"""
+
+    if results.exit_code is None:
+        results.exit_code = 0
+    running_job_exe.task_complete(results)
+
+
+def _task_failed(running_job_exe, results):
+    """Fails the task of the given results"""
+
+    running_job_exe.task_fail(results)
+
+
+# Handlers for the Mesos task states that end a task, except TASK_LOST which needs its own error
+TASK_END_HANDLERS = {mesos_pb2.TASK_FINISHED: _task_finished, mesos_pb2.TASK_ERROR: _task_failed,
+                     mesos_pb2.TASK_FAILED: _task_failed, mesos_pb2.TASK_KILLED: _task_failed}
+
+
+class TaskHandlerThread(threading.Thread):
+    """This class manages the background thread that applies task status updates to the running job executions. This
+    keeps the database and other slow work out of the scheduler's statusUpdate() callback. Updates are handled in the
+    order they were received. This class is thread-safe."""
+
+    COUNT_WARNING_THRESHOLD = 1000  # If the number of waiting updates hits this threshold, log a warning
+    MAX_BATCH_SIZE = 128  # The maximum number of lost job executions to fail in a single database call
+    THROTTLE = 1  # seconds, the maximum time to wait for a new update before checking whether to shut down
+
+    def __init__(self, job_exe_manager, recon_thread):
+        """Constructor
+
+        :param job_exe_manager: The running job execution manager
+        :type job_exe_manager: :class:`job.execution.running.manager.RunningJobExecutionManager`
+        :param recon_thread: The reconciliation thread
+        :type recon_thread: :class:`scheduler.threads.recon.ReconciliationThread`
+        """
+
+        super(TaskHandlerThread, self).__init__()
+        self.daemon = True
+
+        self._job_exe_manager = job_exe_manager
+        self._recon_thread = recon_thread
+        self._condition = threading.Condition()  # Protects _task_updates and _running
+        self._running = True
+        self._task_updates = []
+
+    def add_task_update(self, task_id, state, exit_code, when):
+        """Adds a task status update to be applied to its running job execution
+
+        :param task_id: The ID of the task
+        :type task_id: str
+        :param state: The Mesos task state
+        :type state: int
+        :param exit_code: The exit code of the task, possibly None
+        :type exit_code: int
+        :param when: The time of the status update, possibly None
+        :type when: :class:`datetime.datetime`
+        """
+
+        with self._condition:
+            self._task_updates.append((task_id, state, exit_code, when))
+            self._condition.notify()
+
+    def run(self):
+        """The main run loop of the thread
+        """
+
+        logger.info('Task handler thread started')
+
+        while True:
+
+            with self._condition:
+                if self._running and not self._task_updates:
+                    self._condition.wait(TaskHandlerThread.THROTTLE)
+                if not self._running:
+                    break
+                task_updates = self._task_updates
+                self._task_updates = []
+
+            try:
+                if len(task_updates) >= TaskHandlerThread.COUNT_WARNING_THRESHOLD:
+                    logger.warning('%i task updates waiting to be handled', len(task_updates))
+
+                self._recon_thread.add_task_ids(self._handle_task_updates(task_updates))
+            except Exception:
+                logger.exception('Critical error in task handler thread')
+                # Add all tasks from this pass so they can be reconciled
+                try:
+                    self._recon_thread.add_task_ids([task_update[0] for task_update in task_updates])
+                except Exception:
+                    logger.exception('Unable to add %i task(s) for reconciliation', len(task_updates))
+
+        with self._condition:
+            num_dropped = len(self._task_updates)
+        if num_dropped:
+            logger.warning('Task handler thread dropped %i waiting task update(s) on shutdown', num_dropped)
+        logger.info('Task handler thread stopped')
+
+    def shutdown(self):
+        """Stops the thread from running and performs any needed clean up
+        """
+
+        with self._condition:
+            num_waiting = len(self._task_updates)
+            self._running = False
+            self._condition.notify()
+        logger.info('Shutting down task handler thread with %i waiting task update(s)', num_waiting)
+
+    def _fail_lost_job_exes(self, lost_task_ids):
+        """Fails the given job executions that the scheduler has no knowledge of in a single database call
+
+        :param lost_task_ids: The task IDs of the lost job executions stored by job execution ID
+        :type lost_task_ids: {int: str}
+        :returns: The task IDs that need to be reconciled because their job executions could not be failed
+        :rtype: [str]
+        """
+
+        try:
+            Queue.objects.handle_job_failures(lost_task_ids.keys(), now(), {},
+                                              Error.objects.get_builtin_error('scheduler-lost'))
+        except Exception:
+            logger.exception('Error failing %i lost job execution(s)', len(lost_task_ids))
+            return lost_task_ids.values()
+
+        return []
+
+    def _handle_task_updates(self, task_updates):
+        """Applies the given task status updates to their running job executions. Updates for job executions that the
+        scheduler has no knowledge of are batched together so those executions can be failed with a few bulk database
+        calls.
+
+        :param task_updates: The list of task updates as (task ID, state, exit code, when) tuples
+        :type task_updates: [tuple]
+        :returns: The task IDs that need to be reconciled because their updates could not be handled
+        :rtype: [str]
+        """
+
+        task_ids_to_reconcile = []
+        lost_task_ids = {}  # {Job Exe ID: Task ID}
+
+        for task_id, state, exit_code, when in task_updates:
+            try:
+                job_exe_id = RunningJobExecution.get_job_exe_id(task_id)
+                running_job_exe = self._job_exe_manager.get_job_exe(job_exe_id)
+            except Exception:
+                logger.exception('Error finding job execution for status update of task: %s', task_id)
+                task_ids_to_reconcile.append(task_id)
+                continue
+
+            if running_job_exe:
+                if not self._handle_task_update(running_job_exe, task_id, state, exit_code, when):
+                    task_ids_to_reconcile.append(task_id)
+            else:
+                # Scheduler doesn't have any knowledge of this job execution
+                lost_task_ids[job_exe_id] = task_id
+                if len(lost_task_ids) >= TaskHandlerThread.MAX_BATCH_SIZE:
+                    task_ids_to_reconcile.extend(self._fail_lost_job_exes(lost_task_ids))
+                    lost_task_ids = {}
+
+        if lost_task_ids:
+            task_ids_to_reconcile.extend(self._fail_lost_job_exes(lost_task_ids))
+
+        return task_ids_to_reconcile
+
+    def _handle_task_update(self, running_job_exe, task_id, state, exit_code, when):
+        """Applies the given task status update to its running job execution
+
+        :param running_job_exe: The running job execution of the task
+        :type running_job_exe: :class:`job.execution.running.job_exe.RunningJobExecution`
+        :param task_id: The ID of the task
+        :type task_id: str
+        :param state: The Mesos task state
+        :type state: int
+        :param exit_code: The exit code of the task, possibly None
+        :type exit_code: int
+        :param when: The time of the status update, possibly None
+        :type when: :class:`datetime.datetime`
+        :returns: True if the update was handled, False if there was an error and the task needs to be reconciled
+        :rtype: bool
+        """
+
+        try:
+            results = TaskResults(task_id)
+            results.exit_code = exit_code
+            results.when = when
+            # Apply status update to running job execution
+            handler = TASK_END_HANDLERS.get(state)
+            if handler:
+                handler(running_job_exe, results)
+            elif state == mesos_pb2.TASK_RUNNING:
+                running_job_exe.task_start(task_id, results.when)
+            elif state == mesos_pb2.TASK_LOST:
+                running_job_exe.task_fail(results, Error.objects.get_builtin_error('mesos-lost'))
+
+            # Remove finished job execution
+            if running_job_exe.is_finished():
+                self._job_exe_manager.remove_job_exe(running_job_exe.id)
+        except Exception:
+            logger.exception('Error handling status update for job execution: %s', running_job_exe.id)
+            return False
+
+        return True